@@ -2,4 +2,46 @@ from evennia import Command as BaseCommand
 
 
 class ClassCommand(BaseCommand):
-    help_category = "class abilities"
\ No newline at end of file
+    help_category = "class abilities"
+
+    def _multi_search(self, names):
+        """
+        Look up several objects with a single pass over the caller's
+        inventory and location. Only a key or alias that belongs to a
+        single object counts as a match; any other name (no exact match,
+        or several objects sharing it) falls back to a regular search,
+        once per distinct name, so multimatches are still reported.
+
+        Args:
+            names (list of str): The search terms.
+
+        Returns:
+            matches (list): One object (or None) per search term.
+        """
+        candidates = {}
+        ambiguous = set()
+        for obj in self.caller.contents + self.caller.location.contents:
+            for key in [obj.key] + obj.aliases.all():
+                key = key.lower()
+                if candidates.setdefault(key, obj) != obj:
+                    ambiguous.add(key)
+        matches = {}
+        for name in names:
+            lname = name.lower()
+            if lname not in matches:
+                match = None if lname in ambiguous else candidates.get(lname)
+                matches[lname] = match or self.caller.search(name)
+        return [matches[name.lower()] for name in names]
+
+    def _emote(self, self_text, room_text):
+        """
+        Message the caller and everyone else in the caller's location
+        in a single pass over the location's contents.
+
+        Args:
+            self_text (str): Sent to the caller.
+            room_text (str): Sent to every other object in the location.
+        """
+        caller = self.caller
+        for obj in caller.location.contents:
+            obj.msg(self_text if obj == caller else room_text)
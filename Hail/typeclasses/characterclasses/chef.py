@@ -2,6 +2,7 @@ from evennia import DefaultCharacter
 from evennia.commands.cmdset import CmdSet
 from evennia import Command as BaseCommand
 from evennia.utils.spawner import spawn
+from base import ClassCommand
 
 from typeclasses.objects import Vegetable
 from world import prototypes
@@ -12,6 +13,7 @@ class Chef(DefaultCharacter):
 class CmdSetChef(CmdSet):
 
     key = "chef_cmdset"
+    priority = 1
 
     def at_cmdset_creation(self):
         "called at cmdset creation"
@@ -19,7 +21,7 @@ class CmdSetChef(CmdSet):
         self.add(Grate())
         self.add(Recipes())
 
-class Prepare(BaseCommand):
+class Prepare(ClassCommand):
     """
     Chop up a vegetable to create edible and regrowable parts
 
@@ -28,7 +30,6 @@ class Prepare(BaseCommand):
     """
 
     key = "prepare"
-    help_category = "class abilities"
 
     def func(self):
 
@@ -36,18 +37,14 @@ class Prepare(BaseCommand):
         veg = self.caller.search(veg)
         if not veg:
             self.caller.msg("What do you want to chop up?")
-        elif type(veg) != Vegetable:
+        elif not isinstance(veg, Vegetable):
             self.caller.msg("That's not a vegetable. It's  {}".format(type(veg)))
         elif veg.db.produce.upper() not in prototypes.EDIBLEVEGS:
             self.caller.msg("You don't know how to prepare that vegetable. {}".format(prototypes.EDIBLEVEGS))
         else:
-            self.caller.msg("You chop up the {}".format(veg.key.lower()))
-            self.caller.location.msg_contents("{} chops up the {}".format(
-                self.caller,
-                veg.key.lower()
-            ),
-                exclude=self.caller
-            )
+            veg_name = veg.key.lower()
+            self._emote("You chop up the {}".format(veg_name),
+                        "{} chops up the {}".format(self.caller, veg_name))
 
             food = spawn(prototypes.proto(veg.db.produce))[0]
             seed = spawn(prototypes.proto(veg.db.seed))[0]
@@ -55,7 +52,7 @@ class Prepare(BaseCommand):
             seed.location = self.caller
             food.location = self.caller
 
-class Grate(BaseCommand):
+class Grate(ClassCommand):
     """
         Grate a vegetable
 
@@ -64,7 +61,6 @@ class Grate(BaseCommand):
         """
 
     key = "grate"
-    help_category = "class abilities"
 
     def func(self):
 
@@ -72,18 +68,14 @@ class Grate(BaseCommand):
         veg = self.caller.search(veg)
         if not veg:
             self.caller.msg("What do you want to grate?")
-        elif type(veg) != Vegetable:
+        elif not isinstance(veg, Vegetable):
             self.caller.msg("That's not a vegetable!")
         elif veg.db.produce.upper() not in prototypes.EDIBLEVEGS:
             self.caller.msg("You don't know how to prepare that vegetable.")
         else:
-            self.caller.msg("You chop up the {}".format(veg.key.lower()))
-            self.caller.location.msg_contents("{} chops up the {}".format(
-                self.caller,
-                veg.key.lower()
-            ),
-                exclude=self.caller
-            )
+            veg_name = veg.key.lower()
+            self._emote("You chop up the {}".format(veg_name),
+                        "{} chops up the {}".format(self.caller, veg_name))
 
             food = spawn(prototypes.proto(veg.db.produce))[0]
             seed = spawn(prototypes.proto(veg.db.seed))[0]
@@ -91,19 +83,7 @@ class Grate(BaseCommand):
             seed.location = self.caller
             food.location = self.caller
 
-class Recipes(BaseCommand):
-
-    key = "recipes"
-    help_category = "class abilities"
-
-    def func(self):
-        """
-        Refer to your known recipes
-
-        Usage:
-           recipes
-        """
-        self.caller.msg("""
+_RECIPES_TEXT = """
         MASHED POTATOES AND CARROTS
         ---
 
@@ -111,7 +91,21 @@ class Recipes(BaseCommand):
         2 prepared potatoes
 
         Combine for a tasty salad.
-        """)
+        """
+
+class Recipes(BaseCommand):
+    """
+    Refer to your known recipes
+
+    Usage:
+       recipes
+    """
+
+    key = "recipes"
+    help_category = "class abilities"
+
+    def func(self):
+        self.caller.msg(_RECIPES_TEXT)
 
 class Cook(BaseCommand):
     """
@@ -8,6 +8,7 @@ class Doctor(DefaultCharacter):
 class CmdSetDoctor(CmdSet):
 
     key = "doctor_cmdset"
+    priority = 1
 
     def at_cmdset_creation(self):
         "called at cmdset creation"
@@ -28,15 +29,15 @@ class Diagnose(BaseCommand):
     help_category = "class abilities"
 
     def func(self):
-        try:
-            target = self.caller.search(self.args.strip())
-        except:
+        target = self.caller.search(self.args.strip())
+        if not target:
             self.caller.msg("That's not a thing.")
             return
         # if type(target) != Character:
         #     self.caller.msg("Dammit, Jim, you're a doctor! Not a... whatever would diagnose that.")
-        else:
-            self.caller.msg("""
+        potassium, carbs, magnesium, iron, disorders = target.attributes.get(
+            ["potassium", "carbs", "magnesium", "iron", "disorders"])
+        self.caller.msg("""
             Subject: {t}
             ---
 
@@ -49,13 +50,13 @@ class Diagnose(BaseCommand):
             ---
             {d}
             """.format(
-                t=target,
-                p=target.db.potassium,
-                c=target.db.carbs,
-                m=target.db.magnesium,
-                i=target.db.iron,
-                d=target.db.disorders
-            ))
+            t=target,
+            p=potassium,
+            c=carbs,
+            m=magnesium,
+            i=iron,
+            d=disorders
+        ))
 
 class Inject(BaseCommand):
     """
@@ -69,19 +70,14 @@ class Inject(BaseCommand):
     help_category = "class abilities"
 
     def func(self):
-        args = self.args.strip().split()
-        try:
-            subject = args[0]
-        except Exception as e:
+        args = self.args.strip().split(None, 1)
+        if not args:
             self.caller.msg("Who did you want to pump full of mystery chemicals?")
-            print e
             return
-        try:
-            syringe = " ".join(args[1:])
-        except Exception as e:
+        if len(args) < 2:
             self.caller.msg("Which mystery chemicals did you want to pump them full of?")
-            print e
             return
+        subject, syringe = args
         subject = self.caller.search(subject)
         if not subject:
             self.caller.msg("They don't seem to be here.")
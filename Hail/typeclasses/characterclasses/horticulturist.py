@@ -5,6 +5,25 @@ from ..objects import Seed, HydroponicBed, Fertilizer, Vegetable
 from evennia.utils.spawner import spawn
 from Hail.world.prototypes import PRODUCE_LIST
 
+_ASSESSABLE = (Seed, Vegetable)
+
+_PLANT_SELF = "You plant the {seed} in the {bed}"
+_PLANT_ROOM = "{actor} plants the {seed} in the {bed}"
+_FERTILIZE_SELF = "You fertilize {bed} with {fertilizer}"
+_FERTILIZE_ROOM = "{actor} fertilizes {bed} with {fertilizer}"
+_HARVEST_SELF = "You harvest the {produce} from the {bed}"
+_HARVEST_ROOM = "{actor} harvests the {produce} from the {bed}"
+_CHECK_SELF = "That plant should take about {seconds} seconds to mature."
+_CHECK_ROOM = "{actor} looks impatiently at the {bed}"
+_ASSESS_VEG_FMT = """
+            Vegetable:      {}
+            ------------------
+            Potassium:      {} mg
+            Carbohydrates:  {} mg,
+            Magnesium:      {} mg,
+            Iron:           {} mg
+            """
+
 
 class Horticulturist(DefaultCharacter):
     pass
@@ -13,6 +32,7 @@ class Horticulturist(DefaultCharacter):
 class CmdSetHorticulturist(CmdSet):
 
     key = "horticulturist_cmdset"
+    priority = 1
 
     def at_cmdset_creation(self):
         "called at cmdset creation"
@@ -33,40 +53,36 @@ class Plant(ClassCommand):
     key = "plant"
 
     def func(self):
-        args = self.args.strip().split(" ")
-        try:
-            seed = self.caller.search(args[0])
-        except:
-            self.caller.msg("What is it you want to plant?")
+        msg = self.caller.msg
+        args = self.args.strip().split(None, 1)
+        if not args:
+            msg("What is it you want to plant?")
+            return
+        if len(args) < 2:
+            msg("Where do you want to plant the {seed}?".format(seed=args[0]))
+            return
+        seed, bed = self._multi_search(args)
+        if not isinstance(seed, Seed):
+            msg("You can't plant that!")
             return
-        try:
-            bed = self.caller.search(" ".join(args[1:]))
-        except:
-            self.caller.msg("Where do you want to plant the {seed}?".format(seed=seed))
+        if not isinstance(bed, HydroponicBed):
+            msg("You can't plant the {seed} there!".format(seed=seed))
             return
+        bed_db = bed.db
+        if bed_db.grown:
+            msg("Try harvesting from it first.")
+        elif bed_db.planted:
+            msg("There's already something planted there!")
         else:
-            if type(seed) != Seed:
-                self.caller.msg("You can't plant that!")
-            elif type(bed) != HydroponicBed:
-                self.caller.msg("You can't plant the {seed} there!".format(seed=seed))
-            elif bed.db.grown:
-                self.caller.msg("Try harvesting from it first.")
-            elif bed.db.planted:
-                self.caller.msg("There's already something planted there!")
-            else:
-                self.caller.msg("You plant the {seed} in the {bed}".format(seed=seed, bed=bed))
-                self.caller.location.msg_contents("{actor} plants the {seed} in the {bed}".format(
-                    actor=self.caller,
-                    seed=seed,
-                    bed=bed
-                ),
-                    exclude=self.caller
-                )
-                bed.db.planted = True
-                bed.db.produce = seed.db.produce
-                bed.db.interval = seed.db.growth_time
-                seed.delete()
-                bed.scripts.add("scripts.PlantGrowth")
+            self._emote(_PLANT_SELF.format(seed=seed, bed=bed),
+                        _PLANT_ROOM.format(actor=self.caller, seed=seed, bed=bed))
+            bed_db.planted = True
+            bed_db.produce = seed.db.produce
+            bed_db.interval = seed.db.growth_time
+            seed.delete()
+            scripts = bed.scripts
+            scripts.add("scripts.PlantGrowth")
+            bed.ndb.plantgrowth_script = scripts.get("plantgrowth")[0]
 
 
 class Fertilize(ClassCommand):
@@ -79,26 +95,25 @@ class Fertilize(ClassCommand):
     key = "fertilize"
 
     def func(self):
-        args = self.args.strip().split(" ")
-        bed = self.caller.search(args[0])
-        fertilizer = self.caller.search(" ".join(args[1:]))
+        args = self.args.strip().split(None, 1)
+        if not args:
+            self.caller.msg("What do you want to fertilize?")
+            return
+        if len(args) < 2:
+            self.caller.msg("And what do you intend to fertilize that with?")
+            return
+        bed, fertilizer = self._multi_search(args)
         if not bed:
             self.caller.msg("What do you want to fertilize?")
         elif not fertilizer:
             self.caller.msg("And what do you intend to fertilize that with?")
-        elif type(bed) != HydroponicBed:
+        elif not isinstance(bed, HydroponicBed):
             self.caller.msg("Try as you might, that cannot be fertilized.")
-        elif type(fertilizer) != Fertilizer:
+        elif not isinstance(fertilizer, Fertilizer):
             self.caller.msg("That won't do much good as fertilizer.")
         else:
-            self.caller.msg("You fertilize {bed} with {fertilizer}".format(bed=bed, fertilizer=fertilizer))
-            self.caller.location.msg_contents("{actor} fertilizes {bed} with {fertilizer}".format(
-                actor=self.caller,
-                bed=bed,
-                fertilizer=fertilizer
-            ),
-                exclude=self.caller
-            )
+            self._emote(_FERTILIZE_SELF.format(bed=bed, fertilizer=fertilizer),
+                        _FERTILIZE_ROOM.format(actor=self.caller, bed=bed, fertilizer=fertilizer))
 
 class Harvest(ClassCommand):
     """
@@ -110,31 +125,30 @@ class Harvest(ClassCommand):
     key = "harvest"
 
     def func(self):
-        bed = self.caller.search(self.args.strip())
+        caller = self.caller
+        msg = caller.msg
+        bed = caller.search(self.args.strip())
         if not bed:
-            self.caller.msg("What did you want to harvest from?")
-        elif type(bed) != HydroponicBed:
-            self.caller.msg("You can't harvest from that!")
-        elif not bed.db.planted:
-            self.caller.msg("You cannot reap what you don't sow.")
-        elif not bed.db.grown:
-            self.caller.msg("It's not ready to harvest yet.")
+            msg("What did you want to harvest from?")
+            return
+        if not isinstance(bed, HydroponicBed):
+            msg("You can't harvest from that!")
+            return
+        bed_db = bed.db
+        if not bed_db.planted:
+            msg("You cannot reap what you don't sow.")
+        elif not bed_db.grown:
+            msg("It's not ready to harvest yet.")
         else:
-            self.caller.msg("You harvest the {produce} from the {bed}".format(
-                produce=bed.db.produce.lower(),
-                bed=bed))
-            self.caller.location.msg_contents("{} harvests the {} from the {}".format(
-                self.caller,
-                bed.db.produce.lower(),
-                bed
-            ),
-                exclude=self.caller
-            )
-            bed.db.grown = False
-            bed.db.planted = False
-            bed.db.desc = bed.db.saved_desc
-            produce = spawn(PRODUCE_LIST[bed.db.produce])
-            produce[0].location = self.caller
+            produce_key = bed_db.produce
+            produce_name = produce_key.lower()
+            self._emote(_HARVEST_SELF.format(produce=produce_name, bed=bed),
+                        _HARVEST_ROOM.format(actor=caller, produce=produce_name, bed=bed))
+            bed_db.grown = False
+            bed_db.planted = False
+            bed_db.desc = bed_db.saved_desc
+            produce = spawn(PRODUCE_LIST[produce_key])[0]
+            produce.location = caller
 
 
 class Assess(ClassCommand):
@@ -151,25 +165,14 @@ class Assess(ClassCommand):
         veg = self.caller.search(self.args.strip())
         if not veg:
             self.caller.msg("What do you want to assess?")
-        elif type(veg) not in [Seed, Vegetable]:
+        elif not isinstance(veg, _ASSESSABLE):
             self.caller.msg("You can't assess that!")
-        elif type(veg) == Seed:
+        elif isinstance(veg, Seed):
             self.caller.msg("That seed will take about {} seconds to grow a mature vegetable.".format(veg.db.growth_time))
-        elif type(veg) == Vegetable:
-            self.caller.msg("""
-            Vegetable:      {}
-            ------------------
-            Potassium:      {} mg
-            Carbohydrates:  {} mg,
-            Magnesium:      {} mg,
-            Iron:           {} mg
-            """.format(
-                veg.key,
-                veg.db.potassium,
-                veg.db.carbs,
-                veg.db.magnesium,
-                veg.db.iron
-            ))
+        else:
+            potassium, carbs, magnesium, iron = veg.attributes.get(
+                ["potassium", "carbs", "magnesium", "iron"])
+            self.caller.msg(_ASSESS_VEG_FMT.format(veg.key, potassium, carbs, magnesium, iron))
 
 class Check(ClassCommand):
     """
@@ -184,17 +187,12 @@ class Check(ClassCommand):
         bed = self.caller.search(self.args.strip())
         if not bed:
             self.caller.msg("Which bed did you want to check?")
-        elif type(bed) != HydroponicBed:
+        elif not isinstance(bed, HydroponicBed):
             self.caller.msg("That doesn't appear to be a bed you can check.")
         else:
             try:
-                self.caller.msg("That plant should take about {seconds} seconds to mature.".format(
-                    seconds=bed.scripts.get("plantgrowth")[0].time_until_next_repeat()))
-            except:
-                self.caller.msg("That bed isn't growing anything.")
-            self.caller.location.msg_contents("{} looks impatiently at the {}".format(
-                self.caller,
-                bed
-            ),
-                exclude=self.caller
-            )
+                script = bed.ndb.plantgrowth_script or bed.scripts.get("plantgrowth")[0]
+                self_text = _CHECK_SELF.format(seconds=script.time_until_next_repeat())
+            except (AttributeError, IndexError):
+                self_text = "That bed isn't growing anything."
+            self._emote(self_text, _CHECK_ROOM.format(actor=self.caller, bed=bed))
@@ -51,11 +51,14 @@ class Character(DefaultCharacter):
         self.db.magnesium = 2
         self.db.iron = 2
 
-        self.cmdset.add_default(CharacterCmdSet, permanent=True)
-        self.cmdset.add(horticulturist.CmdSetHorticulturist, permanent=True)
-        self.cmdset.add(doctor.CmdSetDoctor, permanent=True)
+        # only touch the stack when something is missing, so that a
+        # re-puppet doesn't force the cmdsets to be rebuilt and re-merged
+        if not self.cmdset.has_cmdset(CharacterCmdSet.key, must_be_default=True):
+            self.cmdset.add_default(CharacterCmdSet, permanent=True)
+        for cmdset in (horticulturist.CmdSetHorticulturist, doctor.CmdSetDoctor, CmdSetTest):
+            if not self.cmdset.has_cmdset(cmdset.key):
+                self.cmdset.add(cmdset, permanent=True)
         self.cmdset.remove(chef.CmdSetChef)
-        self.cmdset.add(CmdSetTest, permanent=True)
         if self.db.prelogout_location:
             # try to recover
             self.location = self.db.prelogout_location
@@ -110,10 +113,14 @@ class ReroleCmd(BaseCommand):
     key = "rerole"
 
     def func(self):
-        args = self.args.strip().split(" ")
+        args = self.args.strip().split(None, 1)
+        if len(args) < 2:
+            self.caller.msg("Usage: rerole <character> <new title>")
+            return
         obj = self.caller.search(args[0])
-        title = args[1:]
-        obj.db.role = " " + " ".join(title)
+        if not obj:
+            return
+        obj.db.role = " " + args[1]
         self.caller.msg("Done!")
 
 class CmdSetTest(CmdSet):
@@ -121,6 +128,7 @@ class CmdSetTest(CmdSet):
     key = "lightsource_cmdset"
     # this is higher than the dark cmdset - important!
     priority = 3
+    mergetype = "Union"
 
     def at_cmdset_creation(self):
         "called at cmdset creation"
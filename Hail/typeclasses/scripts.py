@@ -117,4 +117,7 @@ class PlantGrowth(DefaultScript):
         if self.obj.db.maturity >= MAX_MATURITY:
             self.obj.db.grown = True
             self.obj.db.desc += " It looks ready for picking."
-            self.stop()
\ No newline at end of file
+            self.stop()
+
+    def at_stop(self):
+        self.obj.ndb.plantgrowth_script = None
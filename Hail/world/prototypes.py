@@ -1,5 +1,3 @@
-import sys
-
 """
 Prototypes
 
@@ -39,7 +37,7 @@ See the `@spawn` command and `evennia.utils.spawner` for more info.
 """
 
 def proto(proto_str):
-    return getattr(sys.modules[__name__], proto_str)
+    return _PROTOTYPES[proto_str]
 
 #########
 # Seeds #
@@ -161,7 +159,7 @@ KALEFOOD = {
 }
 
 POTATOFOOD = {
-    "prototpe": "VEGFOOD",
+    "prototype": "VEGFOOD",
     "key": "prepared potato",
     "desc": "A potato prepared for eating."
 }
@@ -170,4 +168,10 @@ EDIBLEVEGS = {
     "CARROTFOOD": CARROTFOOD,
     "KALEFOOD": KALEFOOD,
     "POTATOFOOD": POTATOFOOD
-}
\ No newline at end of file
+}
+
+# name -> prototype, for proto(). Built last so it sees every prototype;
+# PRODUCE_LIST and EDIBLEVEGS are lookup tables, not prototypes.
+_PROTOTYPES = dict((key, val) for key, val in globals().items()
+                   if key.isupper() and isinstance(val, dict)
+                   and key not in ("PRODUCE_LIST", "EDIBLEVEGS"))
@@ -0,0 +1,88 @@
+"""
+Roles
+
+The roles a character can take aboard the base, in the order they are
+listed by the chargen menu. `ROLE_NAMES`, `ROLE_DETAILS` and
+`ROLE_ENABLED` are parallel tuples indexed by menu number - 1.
+
+"""
+
+ROLE_DETAILS = (
+    """
+            Artificial Intelligence
+            ---
+
+            The AI is free of physical constraints. It can manipulate machinery aboard the base
+            without needing to be physically present in the room. It also has the fastest hacking
+            time of all the classes. However, it can be incapacitated by an engineer who destroys
+            its vulnerable interface sockets.
+            """,
+    """
+            Chef
+            ---
+
+            The chef has free access to the kitchen, which houses the base's supply of food and a
+            fair number of potentially dangerous implements. The chef will rely on the horticulturist
+            to provide a supply of fresh vegetables, and will in turn be responsible for feeding the
+            other colonists.
+            """,
+    """
+            Chemist
+            ---
+
+            The chemist can experiment with different combinations of materials to craft new inventions.
+            The chemist will rely on the engineer to provide the raw materials for these experiments
+            once the initial supplies begin to run low.
+            """,
+    """
+            Doctor
+            ---
+
+            The doctor controls access to the medical bay and can heal the other base staff. Or poison
+            them. All character will rely on the doctor to keep them healthy and the doctor will rely on
+            the chemist and horticulturist to provide the necessary medical supplies.
+            """,
+    """
+            Engineer
+            ---
+
+            The engineer can harvest materials outside the spacebase which the chemist can turn into
+            useful materials, as well as manipulating the machinery around the base. The engineer will
+            rely on the chemist to provide the materials he requires for his job.
+            """,
+    """
+            Horticulturist
+            ---
+
+            The horticulturist controls access to hydroponics and is responsible for growing the renewable
+            materials the spacebase will require. The horticulturist will depend on the engineer and chemist
+            to supply fertilizer to keep the plants growing, and the chef to preserve seeds for regrowing.
+            """,
+    """
+            Port Manager
+            ---
+
+            This class is planned for post-release.
+            """
+)
+
+ROLE_NAMES = (
+    "Artificial Intelligence",
+    "Chef",
+    "Chemist",
+    "Doctor",
+    "Engineer",
+    "Horticulturist",
+    "Port Manager"
+)
+
+# which roles can currently be picked in chargen
+ROLE_ENABLED = (
+    False,
+    False,
+    False,
+    False,
+    False,
+    True,
+    False
+)